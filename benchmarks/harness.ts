@@ -0,0 +1,161 @@
+import { GCProfiler } from 'node:v8'
+import { performance } from 'node:perf_hooks'
+
+/** 单个用例的测量结果。 */
+export interface BenchmarkResult {
+  name: string
+  size: number
+  iterations: number
+  medianMs: number
+  minMs: number
+  /** 单次迭代的平均分配字节数（按 GC 回收量 + 堆增长估算）。 */
+  allocatedBytes: number
+}
+
+/** 基准文件结构：key 为 `用例名@规模`。 */
+export type BenchmarkBaseline = Record<string, Pick<BenchmarkResult, 'medianMs' | 'allocatedBytes'>>
+
+/** 与基准对比的回归项。 */
+export interface BenchmarkRegression {
+  key: string
+  metric: 'medianMs' | 'allocatedBytes'
+  baseline: number
+  current: number
+  ratio: number
+}
+
+/** 低于该耗时的用例只比较分配量，避免计时噪声造成误报。 */
+const MIN_COMPARABLE_MS = 0.5
+
+/** 低于该分配量的用例不比较分配量。 */
+const MIN_COMPARABLE_BYTES = 64 * 1024
+
+/**
+ * 主动触发 GC（需要 `node --expose-gc`），让每次测量从干净的堆开始。
+ */
+function collectGarbage(): void {
+  const gc = (globalThis as { gc?: () => void }).gc
+  gc?.()
+}
+
+/**
+ * 根据规模决定迭代次数：小规模多跑几次降低噪声，大规模控制总耗时。
+ */
+export function resolveIterations(size: number): number {
+  if (size <= 20_000) {
+    return 15
+  }
+
+  if (size <= 200_000) {
+    return 7
+  }
+
+  return 3
+}
+
+/**
+ * 取中位数。
+ */
+function median(values: number[]): number {
+  const sorted = [...values].sort((a, b) => a - b)
+  const middle = Math.floor(sorted.length / 2)
+
+  return sorted.length % 2 === 0 ? (sorted[middle - 1] + sorted[middle]) / 2 : sorted[middle]
+}
+
+/**
+ * 测量一个用例。
+ * `setup` 在每次迭代前执行且不计入耗时，返回值作为 `run` 的输入。
+ */
+export function measure<T>(
+  name: string,
+  size: number,
+  setup: () => T,
+  run: (input: T) => unknown
+): BenchmarkResult {
+  const iterations = resolveIterations(size)
+  const durations: number[] = []
+  let allocatedTotal = 0
+
+  // 预热一次，让 JIT 完成优化，避免首轮编译开销混入结果。
+  run(setup())
+
+  for (let i = 0; i < iterations; i += 1) {
+    const input = setup()
+    collectGarbage()
+
+    const profiler = new GCProfiler()
+    profiler.start()
+    const heapBefore = process.memoryUsage().heapUsed
+    const startedAt = performance.now()
+
+    run(input)
+
+    const elapsed = performance.now() - startedAt
+    const heapAfter = process.memoryUsage().heapUsed
+    const profile = profiler.stop()
+
+    // 分配量 = 迭代期间 GC 回收掉的字节 + 迭代结束时的堆增长。
+    const reclaimed = (profile?.statistics ?? []).reduce((sum, item) => {
+      return sum + Math.max(0, item.beforeGC.heapStatistics.usedHeapSize - item.afterGC.heapStatistics.usedHeapSize)
+    }, 0)
+
+    durations.push(elapsed)
+    allocatedTotal += Math.max(0, heapAfter - heapBefore + reclaimed)
+  }
+
+  return {
+    name,
+    size,
+    iterations,
+    medianMs: median(durations),
+    minMs: Math.min(...durations),
+    allocatedBytes: Math.round(allocatedTotal / iterations)
+  }
+}
+
+/**
+ * 结果对应的基准 key。
+ */
+export function resultKey(result: Pick<BenchmarkResult, 'name' | 'size'>): string {
+  return `${result.name}@${result.size}`
+}
+
+/**
+ * 与基准比较，返回超过阈值的回归项。
+ * `threshold` 为允许的相对增幅，例如 0.25 表示慢 25% 以内不算回归。
+ */
+export function findRegressions(
+  results: BenchmarkResult[],
+  baseline: BenchmarkBaseline,
+  threshold: number
+): BenchmarkRegression[] {
+  const regressions: BenchmarkRegression[] = []
+
+  for (const result of results) {
+    const key = resultKey(result)
+    const expected = baseline[key]
+
+    if (!expected) {
+      continue
+    }
+
+    const checks: Array<[BenchmarkRegression['metric'], number, number, number]> = [
+      ['medianMs', expected.medianMs, result.medianMs, MIN_COMPARABLE_MS],
+      ['allocatedBytes', expected.allocatedBytes, result.allocatedBytes, MIN_COMPARABLE_BYTES]
+    ]
+
+    for (const [metric, baseValue, current, minComparable] of checks) {
+      if (baseValue < minComparable) {
+        continue
+      }
+
+      const ratio = current / baseValue
+      if (ratio > 1 + threshold) {
+        regressions.push({ key, metric, baseline: baseValue, current, ratio })
+      }
+    }
+  }
+
+  return regressions
+}
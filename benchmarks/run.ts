@@ -0,0 +1,280 @@
+import { existsSync, readFileSync, writeFileSync } from 'node:fs'
+import { performance } from 'node:perf_hooks'
+import { buildBoardCards } from '../layers/application/usecases/BuildBoardCardsUseCase'
+import { buildDifficultyProgress } from '../layers/application/usecases/BuildDifficultyProgressUseCase'
+import { buildStatistics } from '../layers/application/usecases/BuildStatisticsUseCase'
+import { selectRoundWords } from '../layers/application/usecases/SelectRoundWordsUseCase'
+import type { LearningRecordMap } from '../layers/domain/entities/LearningRecord'
+import type { Word } from '../layers/domain/entities/Word'
+import {
+  normalizeWordChunks,
+  normalizeWords,
+  type RawWord,
+  type WordChunkManifest
+} from '../layers/infrastructure/data/StaticWordRepository'
+import { LocalStorageLearningRecordRepository } from '../layers/infrastructure/storage/LocalStorageLearningRecordRepository'
+import {
+  findRegressions,
+  measure,
+  resultKey,
+  type BenchmarkBaseline,
+  type BenchmarkResult
+} from './harness'
+import { createChunkPayload, createRawWords, createRecords } from './synthetic'
+
+/**
+ * 客户端热点路径基准测试。
+ *
+ * 用法：
+ *   npm run bench                      # 与 benchmarks/baseline.json 对比，回归超过阈值或缺少基准时退出码为 1
+ *   npm run bench -- --update-baseline # 用本次结果覆盖基准
+ *   npm run bench -- --sizes=11620 --threshold=0.3
+ *
+ * 基准与机器相关，应在同一台（CI）机器上生成并对比。
+ */
+
+/** 默认规模：当前题库、10 万、50 万词条。 */
+const DEFAULT_SIZES = [11_620, 100_000, 500_000]
+
+/** 默认回归阈值（相对增幅）。 */
+const DEFAULT_THRESHOLD = 0.25
+
+/** 合成学习记录覆盖的词条比例。 */
+const LEARNED_RATIO = 0.6
+
+/** 每局题量（与首页最大选项一致）。 */
+const ROUND_COUNT = 15
+
+const BASELINE_PATH = new URL('./baseline.json', import.meta.url)
+
+/** 命令行参数。 */
+interface BenchmarkOptions {
+  sizes: number[]
+  threshold: number
+  updateBaseline: boolean
+}
+
+/**
+ * 解析 `--key=value` 形式的命令行参数。
+ */
+function parseOptions(argv: string[]): BenchmarkOptions {
+  const options: BenchmarkOptions = {
+    sizes: DEFAULT_SIZES,
+    threshold: DEFAULT_THRESHOLD,
+    updateBaseline: false
+  }
+
+  for (const arg of argv) {
+    const [key, value = ''] = arg.split('=')
+
+    if (key === '--sizes') {
+      options.sizes = value
+        .split(',')
+        .map((item) => Number(item.trim()))
+        .filter((item) => Number.isInteger(item) && item > 0)
+    } else if (key === '--threshold') {
+      options.threshold = Number(value)
+    } else if (key === '--update-baseline') {
+      options.updateBaseline = true
+    } else {
+      throw new Error(`未知参数: ${arg}`)
+    }
+  }
+
+  if (options.sizes.length === 0 || !Number.isFinite(options.threshold) || options.threshold < 0) {
+    throw new Error('参数无效：--sizes 需要正整数列表，--threshold 需要非负数')
+  }
+
+  return options
+}
+
+/**
+ * 在 Node 中提供内存版 localStorage，让仓储按浏览器路径执行。
+ */
+function installMemoryLocalStorage(): void {
+  const store = new Map<string, string>()
+
+  const localStorage = {
+    getItem: (key: string) => store.get(key) ?? null,
+    setItem: (key: string, value: string) => {
+      store.set(key, String(value))
+    },
+    removeItem: (key: string) => {
+      store.delete(key)
+    },
+    clear: () => store.clear()
+  }
+
+  Object.assign(globalThis, { window: { localStorage } })
+}
+
+/**
+ * 运行某一规模下的全部用例。
+ */
+function runSize(size: number): BenchmarkResult[] {
+  const rawWords = createRawWords(size)
+  const chunkPayload = createChunkPayload(rawWords)
+  const words: Word[] = normalizeWords(rawWords)
+  const records: LearningRecordMap = createRecords(words, LEARNED_RATIO)
+  const recordRepository = new LocalStorageLearningRecordRepository()
+  const results: BenchmarkResult[] = []
+
+  results.push(measure('normalizeWords', size, () => rawWords, (input) => normalizeWords(input)))
+
+  const parsedChunks = chunkPayload.chunkTexts.map((text) => JSON.parse(text) as RawWord[])
+  results.push(measure('normalizeWordChunks', size, () => parsedChunks, (input) => normalizeWordChunks(input)))
+
+  results.push(
+    measure('selectRoundWords', size, () => records, (input) => {
+      selectRoundWords({ mode: 'newbie', count: ROUND_COUNT, difficulty: 1, words, records: input })
+      selectRoundWords({ mode: 'review', count: ROUND_COUNT, difficulty: 10, words, records: input })
+    })
+  )
+
+  results.push(
+    measure('buildStatistics', size, () => records, (input) => {
+      buildStatistics(words, input, 'count-desc', 'all')
+      buildStatistics(words, input, 'kanji-asc', 'learned')
+    })
+  )
+
+  results.push(measure('buildDifficultyProgress', size, () => records, (input) => buildDifficultyProgress(words, input)))
+
+  results.push(measure('buildBoardCards', size, () => words, (input) => buildBoardCards(input)))
+
+  results.push(
+    measure('localStorageRoundTrip', size, () => records, (input) => {
+      recordRepository.saveAllRecords(input)
+      return recordRepository.getAllRecords()
+    })
+  )
+
+  // 启动路径：与 StaticWordRepository.loadChunks 相同，解析清单与各分片 -> 合并排序并规范化
+  // -> 读取记录 -> 难度进度 -> 出题 -> 首个板面。
+  recordRepository.saveAllRecords(records)
+  results.push(
+    measure('startupToFirstBoard', size, () => chunkPayload, (payload) => {
+      const manifest = JSON.parse(payload.manifestText) as WordChunkManifest
+      const chunks = manifest.chunks.map((_, position) => JSON.parse(payload.chunkTexts[position]) as RawWord[])
+      const startupWords = normalizeWordChunks(chunks)
+      const startupRecords = recordRepository.getAllRecords()
+      buildDifficultyProgress(startupWords, startupRecords)
+
+      const selection = selectRoundWords({
+        mode: 'newbie',
+        count: 10,
+        difficulty: 1,
+        words: startupWords,
+        records: startupRecords
+      })
+
+      return buildBoardCards(selection.words)
+    })
+  )
+
+  return results
+}
+
+/**
+ * 格式化字节数。
+ */
+function formatBytes(bytes: number): string {
+  if (bytes >= 1024 * 1024) {
+    return `${(bytes / 1024 / 1024).toFixed(1)} MB`
+  }
+
+  return `${(bytes / 1024).toFixed(1)} KB`
+}
+
+/**
+ * 输出结果表格。
+ */
+function printResults(results: BenchmarkResult[]): void {
+  console.log(`${'case'.padEnd(34)}${'median'.padStart(12)}${'min'.padStart(12)}${'alloc/iter'.padStart(14)}`)
+
+  for (const result of results) {
+    console.log(
+      `${resultKey(result).padEnd(34)}${`${result.medianMs.toFixed(2)} ms`.padStart(12)}` +
+        `${`${result.minMs.toFixed(2)} ms`.padStart(12)}${formatBytes(result.allocatedBytes).padStart(14)}`
+    )
+  }
+}
+
+/**
+ * 读取基准文件，不存在时返回 null。
+ */
+function readBaseline(): BenchmarkBaseline | null {
+  if (!existsSync(BASELINE_PATH)) {
+    return null
+  }
+
+  return JSON.parse(readFileSync(BASELINE_PATH, 'utf-8')) as BenchmarkBaseline
+}
+
+/**
+ * 用本次结果更新基准（保留其他规模的已有条目）。
+ */
+function writeBaseline(results: BenchmarkResult[], previous: BenchmarkBaseline | null): void {
+  const next: BenchmarkBaseline = { ...(previous ?? {}) }
+
+  for (const result of results) {
+    next[resultKey(result)] = {
+      medianMs: Number(result.medianMs.toFixed(3)),
+      allocatedBytes: result.allocatedBytes
+    }
+  }
+
+  writeFileSync(BASELINE_PATH, `${JSON.stringify(next, null, 2)}\n`)
+}
+
+/**
+ * 主流程：逐规模测量 -> 输出 -> 与基准对比或更新基准。
+ */
+function main(): void {
+  const options = parseOptions(process.argv.slice(2))
+
+  if (typeof (globalThis as { gc?: unknown }).gc !== 'function') {
+    console.warn('[bench] 未启用 --expose-gc，分配量与耗时噪声会更大')
+  }
+
+  installMemoryLocalStorage()
+
+  const results: BenchmarkResult[] = []
+  for (const size of options.sizes) {
+    const startedAt = performance.now()
+    results.push(...runSize(size))
+    console.log(`[bench] size ${size} done in ${((performance.now() - startedAt) / 1000).toFixed(1)} s`)
+  }
+
+  printResults(results)
+
+  const baseline = readBaseline()
+
+  if (options.updateBaseline) {
+    writeBaseline(results, baseline)
+    console.log(`[bench] baseline updated: ${BASELINE_PATH.pathname}`)
+    return
+  }
+
+  if (!baseline) {
+    console.error('[bench] 未找到基准文件 benchmarks/baseline.json，请先在当前机器运行 `npm run bench -- --update-baseline`')
+    process.exitCode = 1
+    return
+  }
+
+  const regressions = findRegressions(results, baseline, options.threshold)
+  if (regressions.length === 0) {
+    console.log(`[bench] no regressions beyond ${(options.threshold * 100).toFixed(0)}%`)
+    return
+  }
+
+  for (const item of regressions) {
+    console.error(
+      `[bench] regression ${item.key} ${item.metric}: ${item.baseline} -> ${item.current} (x${item.ratio.toFixed(2)})`
+    )
+  }
+
+  process.exitCode = 1
+}
+
+main()
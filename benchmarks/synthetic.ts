@@ -0,0 +1,136 @@
+import type { LearningRecordMap } from '../layers/domain/entities/LearningRecord'
+import type { Word } from '../layers/domain/entities/Word'
+import { DIFFICULTY_LEVELS, mapWordLevelToDifficulty } from '../layers/domain/valueObjects/DifficultyLevel'
+import type { RawWord, WordChunkManifest } from '../layers/infrastructure/data/StaticWordRepository'
+
+/** 合成汉字池（常用字）。 */
+const KANJI_POOL = '日本語学習漢字読音生活時間会社電車天気食事友達先生学校仕事旅行新聞映画音楽家族'
+
+/** 合成假名池。 */
+const KANA_POOL = 'あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわん'
+
+/** 合成记录的时间范围起点（2025-01-01）。 */
+const RECORD_START_MS = Date.UTC(2025, 0, 1)
+
+/** 合成记录的时间跨度（约一年）。 */
+const RECORD_SPAN_MS = 365 * 24 * 60 * 60 * 1000
+
+/**
+ * 可复现的伪随机数生成器（mulberry32）。
+ * 同一 seed 生成相同数据，保证多次基准之间可比较。
+ */
+export function createRandom(seed: number): () => number {
+  let state = seed >>> 0
+
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0
+    let t = state
+    t = Math.imul(t ^ (t >>> 15), t | 1)
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61)
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296
+  }
+}
+
+/**
+ * 从字符池中随机拼接字符串。
+ */
+function pickText(random: () => number, pool: string, minLength: number, maxLength: number): string {
+  const length = minLength + Math.floor(random() * (maxLength - minLength + 1))
+  let text = ''
+
+  for (let i = 0; i < length; i += 1) {
+    text += pool[Math.floor(random() * pool.length)]
+  }
+
+  return text
+}
+
+/**
+ * 生成与 parsed_words_11620.json 结构一致的原始词条。
+ * 约 2% 的词条为纯假名，用于覆盖规范化中的过滤分支。
+ */
+export function createRawWords(size: number, seed = 1): RawWord[] {
+  const random = createRandom(seed)
+  const words: RawWord[] = []
+
+  for (let i = 0; i < size; i += 1) {
+    const ruby = pickText(random, KANA_POOL, 2, 6)
+    const kanji = random() < 0.02 ? ruby : pickText(random, KANJI_POOL, 1, 4)
+
+    words.push({
+      kanji,
+      ruby,
+      level: Math.round(random() * 1000) / 100,
+      jp_meanings: [`${kanji}の意味`, `${ruby}の用法`],
+      zh_meanings: [`${kanji}的意思`],
+      example_sentence: `この文脈では「${kanji}（${ruby}）」を使います。`,
+      example_translation: `在这个语境中使用“${kanji}（${ruby}）”。`
+    })
+  }
+
+  return words
+}
+
+/** 与 `scripts/build_word_chunks.py` 输出一致的分片载荷（JSON 文本）。 */
+export interface ChunkPayload {
+  manifestText: string
+  chunkTexts: string[]
+}
+
+/**
+ * 按难度把原始词条拆分为分片文本，条目携带原始下标 `index`。
+ * 模拟启动时从网络 / Service Worker 读到的清单与分片内容。
+ */
+export function createChunkPayload(rawWords: RawWord[]): ChunkPayload {
+  const groups = new Map<number, RawWord[]>(DIFFICULTY_LEVELS.map((difficulty) => [difficulty, []]))
+
+  rawWords.forEach((word, index) => {
+    const difficulty = mapWordLevelToDifficulty(word.level ?? 10)
+    groups.get(difficulty)!.push({ index, ...word })
+  })
+
+  const manifest: WordChunkManifest = {
+    version: 'synthetic',
+    total: rawWords.length,
+    chunks: DIFFICULTY_LEVELS.map((difficulty) => ({
+      difficulty,
+      file: `words-lv${difficulty}.synthetic.json`,
+      hash: 'synthetic',
+      count: groups.get(difficulty)!.length
+    }))
+  }
+
+  return {
+    manifestText: JSON.stringify(manifest),
+    chunkTexts: DIFFICULTY_LEVELS.map((difficulty) => JSON.stringify(groups.get(difficulty)))
+  }
+}
+
+/**
+ * 为给定词条生成学习记录。
+ * `learnedRatio` 控制有记录的词条比例，模拟长期学习后的历史数据。
+ */
+export function createRecords(words: Word[], learnedRatio: number, seed = 2): LearningRecordMap {
+  const random = createRandom(seed)
+  const records: LearningRecordMap = {}
+
+  for (const word of words) {
+    if (random() >= learnedRatio) {
+      continue
+    }
+
+    const first = RECORD_START_MS + Math.floor(random() * RECORD_SPAN_MS)
+    const last = first + Math.floor(random() * (RECORD_START_MS + RECORD_SPAN_MS - first))
+
+    records[word.id] = {
+      wordId: word.id,
+      kanji: word.kanji,
+      ruby: word.ruby,
+      correctCount: 1 + Math.floor(random() * 20),
+      firstCorrectAt: new Date(first).toISOString(),
+      lastCorrectAt: new Date(last).toISOString()
+    }
+  }
+
+  return records
+}
@@ -5,6 +5,9 @@ import type { Word } from '../entities/Word'
  * Domain 层只依赖接口，不依赖具体数据来源。
  */
 export interface IWordRepository {
+  /** 加载题库数据，完成前 `getAllWords` 返回空列表；加载失败时 Promise 被拒绝。 */
+  load(): Promise<void>
+
   /** 获取全部可用词条。 */
   getAllWords(): Word[]
 
@@ -1,11 +1,11 @@
-import rawWords from '~/parsed_words_11620.json'
 import type { Word } from '../../domain/entities/Word'
 import type { IWordRepository } from '../../domain/repositories/IWordRepository'
 
 /**
  * 原始题库结构。
  */
-interface RawWord {
+export interface RawWord {
+  index?: number
   kanji?: string
   ruby?: string
   level?: number
@@ -15,6 +15,32 @@ interface RawWord {
   example_translation?: string
 }
 
+/**
+ * 分片清单中的单个分片描述。
+ * 由 `scripts/build_word_chunks.py` 生成，文件名带内容哈希。
+ */
+export interface WordChunkDescriptor {
+  difficulty: number
+  file: string
+  hash: string
+  count: number
+}
+
+/**
+ * 分片清单结构。
+ */
+export interface WordChunkManifest {
+  version: string
+  total: number
+  chunks: WordChunkDescriptor[]
+}
+
+/** 分片数据所在目录（对应 `public/data`）。 */
+const DATA_BASE_PATH = '/data'
+
+/** 分片清单地址。 */
+const MANIFEST_URL = `${DATA_BASE_PATH}/manifest.json`
+
 /**
  * 检查字符串是否包含汉字。
  * 规则：含有任意 CJK Unified Ideographs 即视为“汉字词”。
@@ -39,10 +65,12 @@ function normalizeStringArray(source: string[] | undefined): string[] {
 /**
  * 把原始题库条目规范化为领域实体。
  */
-function normalizeWords(source: RawWord[]): Word[] {
+export function normalizeWords(source: RawWord[]): Word[] {
   const normalized: Word[] = []
 
-  source.forEach((entry, index) => {
+  source.forEach((entry, position) => {
+    // 分片条目携带原始下标，保证 ID 与拆分前一致。
+    const index = typeof entry.index === 'number' ? entry.index : position
     const kanji = (entry.kanji ?? '').trim()
     const ruby = (entry.ruby ?? '').trim()
 
@@ -71,15 +99,65 @@ function normalizeWords(source: RawWord[]): Word[] {
   return normalized
 }
 
+/**
+ * 合并按难度拆分的分片，按原始下标恢复词条顺序后规范化。
+ * 纯函数，供仓储加载与基准测试共用。
+ */
+export function normalizeWordChunks(chunks: RawWord[][]): Word[] {
+  const entries = chunks.flat().sort((a, b) => (a.index ?? 0) - (b.index ?? 0))
+  return normalizeWords(entries)
+}
+
+/**
+ * 读取 JSON 资源，失败时抛出带地址的错误。
+ */
+async function fetchJson<T>(url: string, init?: RequestInit): Promise<T> {
+  const response = await fetch(url, init)
+
+  if (!response.ok) {
+    throw new Error(`题库加载失败: ${url} (${response.status})`)
+  }
+
+  return (await response.json()) as T
+}
+
 /**
  * 静态题库仓储实现。
- * 直接从项目内 JSON 文件加载，并在构造时完成规范化。
+ * 从 `public/data` 下的内容哈希分片加载题库，分片由 Service Worker 缓存，
+ * 再次访问时只会下载哈希变化的分片。
  */
 export class StaticWordRepository implements IWordRepository {
-  private readonly words: Word[]
+  private words: Word[] = []
+  private loading: Promise<void> | null = null
+
+  /**
+   * 并行加载全部分片并完成规范化；重复调用复用同一次加载。
+   * 首次失败时绕过 HTTP 缓存重试一次（应对网络抖动或部署未完全生效），仍失败才抛出。
+   */
+  load(): Promise<void> {
+    if (!this.loading) {
+      this.loading = this.loadChunks('default')
+        .catch(() => this.loadChunks('reload'))
+        .catch((error) => {
+          this.loading = null
+          throw error
+        })
+    }
+
+    return this.loading
+  }
+
+  /** 读取清单后并行下载分片，按原始下标恢复词条顺序。 */
+  private async loadChunks(cacheMode: RequestCache): Promise<void> {
+    // 清单很小且决定分片版本，要求每次都向服务端确认。
+    const manifest = await fetchJson<WordChunkManifest>(MANIFEST_URL, {
+      cache: cacheMode === 'default' ? 'no-cache' : cacheMode
+    })
+    const chunks = await Promise.all(
+      manifest.chunks.map((chunk) => fetchJson<RawWord[]>(`${DATA_BASE_PATH}/${chunk.file}`, { cache: cacheMode }))
+    )
 
-  constructor() {
-    this.words = normalizeWords(rawWords as RawWord[])
+    this.words = normalizeWordChunks(chunks)
   }
 
   /** 获取全部单词。 */
@@ -55,6 +55,8 @@ export const useGameStore = defineStore('game-store', () => {
   const initialized = ref(false)
 
   const words = ref<Word[]>([])
+  const wordDataLoading = ref(false)
+  const wordDataError = ref<string | null>(null)
   const records = ref<LearningRecordMap>({})
 
   const mode = ref<GameMode>('newbie')
@@ -114,6 +116,32 @@ export const useGameStore = defineStore('game-store', () => {
     initialized.value = true
   }
 
+  /**
+   * 异步加载题库分片。
+   * 应在页面渲染前调用（见 `plugins/wordData.client.ts`）。
+   * 失败时不抛出，而是写入 `wordDataError`，由页面提示并提供重试。
+   */
+  async function loadWordData(): Promise<boolean> {
+    wordDataLoading.value = true
+    wordDataError.value = null
+
+    try {
+      await wordRepository.load()
+    } catch (error) {
+      console.warn('[word-data] 题库加载失败', error)
+      wordDataError.value = '题库加载失败，请检查网络后重试。'
+      return false
+    } finally {
+      wordDataLoading.value = false
+    }
+
+    if (initialized.value) {
+      words.value = wordRepository.getAllWords()
+    }
+
+    return true
+  }
+
   /**
    * 持久化学习记录到 localStorage。
    */
@@ -423,6 +451,8 @@ export const useGameStore = defineStore('game-store', () => {
   }
 
   return {
+    wordDataLoading,
+    wordDataError,
     mode,
     requestedCount,
     difficulty,
@@ -444,6 +474,7 @@ export const useGameStore = defineStore('game-store', () => {
     isPlaying,
     canStartReviewMode,
     ensureInitialized,
+    loadWordData,
     startRound,
     selectKanjiCard,
     selectRubyCard,
@@ -0,0 +1,28 @@
+import { useGameStore } from '~/layers/presentation/stores/gameStore'
+
+/** 题库缓存 Service Worker 地址（对应 `public/sw.js`）。 */
+const SERVICE_WORKER_URL = '/sw.js'
+
+/**
+ * 注册题库缓存 Service Worker。
+ * 注册失败不影响游戏，只是无法享受离线缓存。
+ */
+function registerWordDataServiceWorker(): void {
+  if (!('serviceWorker' in navigator)) {
+    return
+  }
+
+  navigator.serviceWorker.register(SERVICE_WORKER_URL).catch((error) => {
+    console.warn('[sw] 注册失败', error)
+  })
+}
+
+/**
+ * 客户端插件：注册 Service Worker，并在应用挂载前加载题库分片。
+ * 插件返回 Promise 时 Nuxt 会等待其完成，页面中的同步读取因此拿到完整题库；
+ * 加载失败不会中断应用，错误写入 Store，由布局展示并提供重试。
+ */
+export default defineNuxtPlugin(async (nuxtApp) => {
+  registerWordDataServiceWorker()
+  await useGameStore(nuxtApp.$pinia).loadWordData()
+})
@@ -0,0 +1,143 @@
+/**
+ * 题库缓存 Service Worker。
+ * - manifest.json：网络优先，离线时回退缓存
+ * - words-lv*.{hash}.json：缓存优先（文件名带内容哈希，内容不可变）
+ * 每次拿到新清单后清理不再被引用的旧分片，
+ * 再次访问时只会下载哈希发生变化的分片。
+ */
+const CACHE_NAME = 'word-data-v1'
+const DATA_PREFIX = '/data/'
+const MANIFEST_PATH = `${DATA_PREFIX}manifest.json`
+
+/**
+ * 根据清单删除过期分片。
+ */
+async function pruneStaleChunks(cache, manifest) {
+  const keep = new Set(manifest.chunks.map((chunk) => `${DATA_PREFIX}${chunk.file}`))
+  keep.add(MANIFEST_PATH)
+
+  const requests = await cache.keys()
+  await Promise.all(
+    requests
+      .filter((request) => !keep.has(new URL(request.url).pathname))
+      .map((request) => cache.delete(request))
+  )
+}
+
+/**
+ * 补齐清单中尚未缓存的分片。
+ * 首次访问时页面请求发生在 Service Worker 接管之前，这里负责预热缓存。
+ */
+async function warmChunks(cache, manifest) {
+  await Promise.all(
+    manifest.chunks.map(async (chunk) => {
+      const url = `${DATA_PREFIX}${chunk.file}`
+      if (await cache.match(url)) {
+        return
+      }
+
+      const response = await fetch(url)
+      if (response.ok) {
+        await cache.put(url, response)
+      }
+    })
+  )
+}
+
+/**
+ * 网络优先读取清单，成功后同步更新缓存并清理旧分片。
+ */
+async function handleManifest(request) {
+  const cache = await caches.open(CACHE_NAME)
+
+  try {
+    const response = await fetch(request, { cache: 'no-cache' })
+
+    if (response.ok) {
+      await cache.put(MANIFEST_PATH, response.clone())
+      response
+        .clone()
+        .json()
+        .then((manifest) => pruneStaleChunks(cache, manifest))
+        .catch(() => undefined)
+    }
+
+    return response
+  } catch (error) {
+    const cached = await cache.match(MANIFEST_PATH)
+    if (cached) {
+      return cached
+    }
+
+    throw error
+  }
+}
+
+/**
+ * 缓存优先读取分片，未命中时下载并写入缓存。
+ */
+async function handleChunk(request) {
+  const cache = await caches.open(CACHE_NAME)
+  const cached = await cache.match(request)
+  if (cached) {
+    return cached
+  }
+
+  const response = await fetch(request)
+  if (response.ok) {
+    await cache.put(request, response.clone())
+  }
+
+  return response
+}
+
+/**
+ * 激活时预热当前清单对应的分片。
+ */
+async function warmCache() {
+  const cache = await caches.open(CACHE_NAME)
+  const response = await fetch(MANIFEST_PATH, { cache: 'no-cache' })
+  if (!response.ok) {
+    return
+  }
+
+  await cache.put(MANIFEST_PATH, response.clone())
+  const manifest = await response.json()
+  await warmChunks(cache, manifest)
+  await pruneStaleChunks(cache, manifest)
+}
+
+self.addEventListener('install', () => {
+  self.skipWaiting()
+})
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(
+    Promise.all([
+      self.clients.claim(),
+      caches
+        .keys()
+        .then((names) => Promise.all(names.filter((name) => name !== CACHE_NAME).map((name) => caches.delete(name)))),
+      warmCache().catch(() => undefined)
+    ])
+  )
+})
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event
+  if (request.method !== 'GET') {
+    return
+  }
+
+  const url = new URL(request.url)
+  if (url.origin !== self.location.origin || !url.pathname.startsWith(DATA_PREFIX)) {
+    return
+  }
+
+  if (url.pathname === MANIFEST_PATH) {
+    event.respondWith(handleManifest(request))
+    return
+  }
+
+  event.respondWith(handleChunk(request))
+})
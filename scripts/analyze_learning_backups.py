@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+批量分析多个学习数据备份（LearningDataBackup 导出的 JSON）。
+
+适用场景：收集一个班级 / 大量学习者的备份文件，一次性统计整体学习情况，
+替代逐个用户运行 BuildStatisticsUseCase / BuildDifficultyProgressUseCase。
+
+实现说明：
+1) 按 StaticWordRepository 的规则从 parsed_words_11620.json 建立词条索引（word-{index}）
+2) 逐个读取备份文件，把 records 转成与词条索引对齐的列式数组
+   （用户下标、词条列、正确次数、首次/最近学习时间），不保留原始 JSON
+3) 全部读取后用 NumPy 一次性计算：
+   - 每个词条：学会人数、学会比例、累计正确次数
+   - 每个难度：用户学会比例的均值 / 中位数 / P90，以及用户学习等级分布
+   - 最难词条：在“该难度已有学习进度”的用户中，学会比例最低的词条
+   - 活动直方图：按天的首次学会数、按天 / 按小时的最近学习数、每人已学词数分布
+
+依赖：numpy
+用法：python3 scripts/analyze_learning_backups.py backups/ --output report.json --per-word words.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+from build_word_chunks import map_word_level_to_difficulty
+
+try:
+    import regex
+except ImportError:  # 可选依赖：未安装时使用下方的区段表。
+    regex = None
+
+WORDS_PATH = Path("parsed_words_11620.json")
+
+DIFFICULTY_COUNT = 10
+DEFAULT_TOP = 20
+DEFAULT_MIN_USERS = 5
+USER_WORD_BINS = [0, 1, 10, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+# 与前端 `\p{Script=Han}` 一致的汉字判定。
+# 安装了 regex 时直接使用 Unicode 脚本属性；否则使用按 Unicode 16.0（Node 20 ICU）
+# 导出的 Script=Han 区段表，仅在浏览器 Unicode 版本新增汉字区段时可能有差异。
+HAN_RANGES = (
+    (0x2E80, 0x2E99), (0x2E9B, 0x2EF3), (0x2F00, 0x2FD5), (0x3005, 0x3005),
+    (0x3007, 0x3007), (0x3021, 0x3029), (0x3038, 0x303B), (0x3400, 0x4DBF),
+    (0x4E00, 0x9FFF), (0xF900, 0xFA6D), (0xFA70, 0xFAD9), (0x16FE2, 0x16FE3),
+    (0x16FF0, 0x16FF1), (0x20000, 0x2A6DF), (0x2A700, 0x2B739), (0x2B740, 0x2B81D),
+    (0x2B820, 0x2CEA1), (0x2CEB0, 0x2EBE0), (0x2EBF0, 0x2EE5D), (0x2F800, 0x2FA1D),
+    (0x30000, 0x3134A), (0x31350, 0x323AF),
+)
+
+if regex is not None:
+    HAN_RE = regex.compile(r"\p{Script=Han}")
+else:
+    HAN_RE = re.compile("[" + "".join(f"{chr(start)}-{chr(end)}" for start, end in HAN_RANGES) + "]")
+
+
+@dataclass
+class WordIndex:
+    """与前端词条 ID 对齐的词条索引。"""
+
+    ids: list[str]
+    kanji: list[str]
+    ruby: list[str]
+    difficulty: np.ndarray
+    column_by_id: dict[str, int]
+
+
+@dataclass
+class RecordColumns:
+    """所有用户学习记录的列式数组，每行对应一条记录。"""
+
+    user: np.ndarray
+    word: np.ndarray
+    correct_count: np.ndarray
+    first_correct_at: np.ndarray
+    last_correct_at: np.ndarray
+    user_names: list[str]
+    skipped_files: list[str] = field(default_factory=list)
+    unknown_records: int = 0
+    invalid_records: int = 0
+
+
+def load_word_index(path: Path) -> WordIndex:
+    """读取题库并按前端规则过滤，生成对齐的词条索引。"""
+    if not path.exists():
+        raise FileNotFoundError(f"题库文件不存在: {path}")
+
+    with path.open("r", encoding="utf-8") as file:
+        raw_words: list[dict[str, Any]] = json.load(file)
+
+    ids: list[str] = []
+    kanji_list: list[str] = []
+    ruby_list: list[str] = []
+    difficulties: list[int] = []
+
+    for index, entry in enumerate(raw_words):
+        kanji = str(entry.get("kanji") or "").strip()
+        ruby = str(entry.get("ruby") or "").strip()
+
+        # 与 StaticWordRepository 一致：必须有汉字写法和读音，且包含汉字。
+        if not kanji or not ruby or not HAN_RE.search(kanji):
+            continue
+
+        ids.append(f"word-{index}")
+        kanji_list.append(kanji)
+        ruby_list.append(ruby)
+        difficulties.append(map_word_level_to_difficulty(entry.get("level")))
+
+    return WordIndex(
+        ids=ids,
+        kanji=kanji_list,
+        ruby=ruby_list,
+        difficulty=np.asarray(difficulties, dtype=np.int8),
+        column_by_id={word_id: column for column, word_id in enumerate(ids)},
+    )
+
+
+def iter_backup_paths(inputs: list[Path]) -> Iterator[Path]:
+    """展开输入路径：目录递归查找 *.json，文件直接返回。"""
+    for path in inputs:
+        if path.is_dir():
+            yield from sorted(path.rglob("*.json"))
+        elif path.exists():
+            yield path
+        else:
+            print(f"[warn] path not found: {path}", flush=True)
+
+
+def parse_timestamps(values: list[str]) -> np.ndarray:
+    """批量解析 ISO 时间（toISOString 格式），无法解析的值记为 NaT。"""
+    cleaned = [value[:-1] if value.endswith("Z") else value for value in values]
+
+    try:
+        return np.asarray(cleaned, dtype="datetime64[ms]")
+    except ValueError:
+        parsed = np.empty(len(cleaned), dtype="datetime64[ms]")
+        for position, value in enumerate(cleaned):
+            try:
+                parsed[position] = np.datetime64(value, "ms")
+            except ValueError:
+                parsed[position] = np.datetime64("NaT")
+        return parsed
+
+
+def parse_correct_count(value: Any) -> float | None:
+    """校验 correctCount：只接受有限的数值（bool 视为非法），非法时返回 None。
+
+    保留原始数值（不截断为整数），“已学”判定与前端 `correctCount > 0` 一致；
+    统一存为 float64，超大值也不会溢出。
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+
+    number = float(value)
+    return number if math.isfinite(number) else None
+
+
+def read_backup_records(path: Path) -> dict[str, Any] | None:
+    """读取单个备份文件的 records，格式不符时返回 None。"""
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            payload = json.load(file)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    records = payload.get("records") if isinstance(payload, dict) else None
+    return records if isinstance(records, dict) else None
+
+
+def load_record_columns(paths: Iterator[Path], index: WordIndex) -> RecordColumns:
+    """流式读取备份文件，逐文件转换为与词条索引对齐的数组块。"""
+    user_blocks: list[np.ndarray] = []
+    word_blocks: list[np.ndarray] = []
+    count_blocks: list[np.ndarray] = []
+    first_blocks: list[np.ndarray] = []
+    last_blocks: list[np.ndarray] = []
+    user_names: list[str] = []
+    skipped: list[str] = []
+    unknown = 0
+    invalid = 0
+
+    for path in paths:
+        records = read_backup_records(path)
+        if records is None:
+            skipped.append(str(path))
+            continue
+
+        columns: list[int] = []
+        counts: list[float] = []
+        first_values: list[str] = []
+        last_values: list[str] = []
+
+        for word_id, record in records.items():
+            column = index.column_by_id.get(word_id)
+            if column is None:
+                unknown += 1
+                continue
+
+            count = parse_correct_count(record.get("correctCount")) if isinstance(record, dict) else None
+            if count is None:
+                invalid += 1
+                continue
+
+            columns.append(column)
+            counts.append(count)
+            first_values.append(str(record.get("firstCorrectAt") or ""))
+            last_values.append(str(record.get("lastCorrectAt") or ""))
+
+        user_id = len(user_names)
+        user_names.append(str(path))
+
+        user_blocks.append(np.full(len(columns), user_id, dtype=np.int32))
+        word_blocks.append(np.asarray(columns, dtype=np.int32))
+        count_blocks.append(np.asarray(counts, dtype=np.float64))
+        first_blocks.append(parse_timestamps(first_values))
+        last_blocks.append(parse_timestamps(last_values))
+
+        if len(user_names) % 500 == 0:
+            print(f"[load] {len(user_names)} backups", flush=True)
+
+    def concat(blocks: list[np.ndarray], dtype: Any) -> np.ndarray:
+        return np.concatenate(blocks) if blocks else np.empty(0, dtype=dtype)
+
+    return RecordColumns(
+        user=concat(user_blocks, np.int32),
+        word=concat(word_blocks, np.int32),
+        correct_count=concat(count_blocks, np.float64),
+        first_correct_at=concat(first_blocks, "datetime64[ms]"),
+        last_correct_at=concat(last_blocks, "datetime64[ms]"),
+        user_names=user_names,
+        skipped_files=skipped,
+        unknown_records=unknown,
+        invalid_records=invalid,
+    )
+
+
+def day_histogram(timestamps: np.ndarray) -> dict[str, int]:
+    """按自然日（UTC）统计时间戳数量。"""
+    valid = timestamps[~np.isnat(timestamps)]
+    days, counts = np.unique(valid.astype("datetime64[D]"), return_counts=True)
+    return {str(day): int(count) for day, count in zip(days, counts)}
+
+
+def hour_histogram(timestamps: np.ndarray) -> list[int]:
+    """按小时（UTC，0~23）统计时间戳数量。"""
+    valid = timestamps[~np.isnat(timestamps)]
+    hours = (valid.astype("datetime64[h]") - valid.astype("datetime64[D]")).astype(np.int64)
+    return np.bincount(hours, minlength=24).astype(int).tolist()
+
+
+def analyze(index: WordIndex, columns: RecordColumns, top: int, min_users: int) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    """一次性计算全部统计，返回报告与逐词条数组。"""
+    word_count = len(index.ids)
+    user_count = len(columns.user_names)
+
+    learned = columns.correct_count > 0
+    learned_users = columns.user[learned]
+    learned_words = columns.word[learned]
+    learned_difficulty = index.difficulty[learned_words].astype(np.int64) - 1
+
+    # 每个词条：学会人数与累计正确次数。
+    learners = np.bincount(learned_words, minlength=word_count)
+    total_correct = np.bincount(columns.word, weights=np.maximum(columns.correct_count, 0), minlength=word_count)
+
+    # 每个用户 x 难度：已学词数。
+    words_per_difficulty = np.bincount(index.difficulty.astype(np.int64) - 1, minlength=DIFFICULTY_COUNT)
+    user_level_learned = np.bincount(
+        learned_users.astype(np.int64) * DIFFICULTY_COUNT + learned_difficulty,
+        minlength=user_count * DIFFICULTY_COUNT,
+    ).reshape(user_count, DIFFICULTY_COUNT)
+    user_level_rate = user_level_learned / np.maximum(words_per_difficulty, 1)
+
+    # 用户学习等级：与 estimateUserDifficulty 相同的加权平均（无已学词条时为 1）。
+    user_learned_total = user_level_learned.sum(axis=1)
+    weighted = user_level_learned @ np.arange(1, DIFFICULTY_COUNT + 1)
+    average = np.divide(weighted, user_learned_total, out=np.ones(user_count), where=user_learned_total > 0)
+    user_level = np.clip(np.floor(average + 0.5), 1, DIFFICULTY_COUNT).astype(np.int64)
+
+    # 最难词条：只在该难度已有学习进度的用户中比较，避免未接触该难度的用户拉低比例。
+    active_per_difficulty = (user_level_learned > 0).sum(axis=0)
+    eligible = active_per_difficulty[index.difficulty.astype(np.int64) - 1]
+    learned_rate = np.divide(learners, eligible, out=np.zeros(word_count), where=eligible > 0)
+
+    candidates = np.flatnonzero(eligible >= min_users)
+    hardest = candidates[np.lexsort((-eligible[candidates], learned_rate[candidates]))][:top]
+    most_learned = np.argsort(-learners, kind="stable")[:top]
+
+    def word_item(column: int) -> dict[str, Any]:
+        return {
+            "wordId": index.ids[column],
+            "kanji": index.kanji[column],
+            "ruby": index.ruby[column],
+            "difficulty": int(index.difficulty[column]),
+            "learners": int(learners[column]),
+            "eligibleUsers": int(eligible[column]),
+            "learnedRate": round(float(learned_rate[column]), 4),
+        }
+
+    levels = []
+    for position in range(DIFFICULTY_COUNT):
+        rates = user_level_rate[:, position] if user_count else np.zeros(1)
+        levels.append(
+            {
+                "difficulty": position + 1,
+                "totalWords": int(words_per_difficulty[position]),
+                "activeUsers": int(active_per_difficulty[position]),
+                "meanLearnedRate": round(float(rates.mean()), 4),
+                "medianLearnedRate": round(float(np.median(rates)), 4),
+                "p90LearnedRate": round(float(np.percentile(rates, 90)), 4),
+            }
+        )
+
+    user_word_counts, _ = np.histogram(user_learned_total, bins=USER_WORD_BINS + [np.iinfo(np.int64).max])
+    first_learned = columns.first_correct_at[learned]
+    last_learned = columns.last_correct_at[learned]
+
+    report = {
+        "users": user_count,
+        "skippedFiles": columns.skipped_files,
+        "words": word_count,
+        "records": int(columns.word.size),
+        "unknownRecords": columns.unknown_records,
+        "invalidRecords": columns.invalid_records,
+        "levels": levels,
+        "userLevelDistribution": {
+            str(level): int(count)
+            for level, count in enumerate(np.bincount(user_level, minlength=DIFFICULTY_COUNT + 1)[1:], start=1)
+        },
+        "hardestWords": [word_item(column) for column in hardest],
+        "mostLearnedWords": [word_item(column) for column in most_learned if learners[column] > 0],
+        "activity": {
+            "firstLearnedByDay": day_histogram(first_learned),
+            "lastActiveByDay": day_histogram(last_learned),
+            "lastActiveByHourUtc": hour_histogram(last_learned),
+            "learnedWordsPerUser": {
+                "binStarts": USER_WORD_BINS,
+                "counts": user_word_counts.astype(int).tolist(),
+            },
+        },
+    }
+
+    per_word = {
+        "learners": learners,
+        "eligible": eligible,
+        "learnedRate": learned_rate,
+        "totalCorrect": total_correct,
+    }
+
+    return report, per_word
+
+
+def write_per_word_csv(path: Path, index: WordIndex, per_word: dict[str, np.ndarray]) -> None:
+    """输出逐词条统计 CSV（与词条索引顺序一致）。"""
+    with path.open("w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["wordId", "kanji", "ruby", "difficulty", "learners", "eligibleUsers", "learnedRate", "totalCorrect"])
+
+        for column, word_id in enumerate(index.ids):
+            writer.writerow(
+                [
+                    word_id,
+                    index.kanji[column],
+                    index.ruby[column],
+                    int(index.difficulty[column]),
+                    int(per_word["learners"][column]),
+                    int(per_word["eligible"][column]),
+                    f"{per_word['learnedRate'][column]:.4f}",
+                    int(round(per_word["totalCorrect"][column])),
+                ]
+            )
+
+
+def print_summary(report: dict[str, Any]) -> None:
+    """在终端输出报告摘要。"""
+    print(
+        f"[summary] users: {report['users']}, records: {report['records']}, "
+        f"unknown records: {report['unknownRecords']}, invalid records: {report['invalidRecords']}, skipped files: {len(report['skippedFiles'])}",
+        flush=True,
+    )
+
+    print("[summary] level  words  active   mean  median    p90", flush=True)
+    for item in report["levels"]:
+        print(
+            f"[summary] Lv.{item['difficulty']:<3} {item['totalWords']:>6} {item['activeUsers']:>7} "
+            f"{item['meanLearnedRate']:>6.1%} {item['medianLearnedRate']:>7.1%} {item['p90LearnedRate']:>6.1%}",
+            flush=True,
+        )
+
+    print("[summary] hardest words:", flush=True)
+    for item in report["hardestWords"]:
+        print(
+            f"[summary]   {item['kanji']}（{item['ruby']}） Lv.{item['difficulty']} "
+            f"{item['learners']}/{item['eligibleUsers']} ({item['learnedRate']:.1%})",
+            flush=True,
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    """解析命令行参数。"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", type=Path, help="备份文件或目录（目录会递归查找 *.json）")
+    parser.add_argument("--words", type=Path, default=WORDS_PATH, help="题库文件路径")
+    parser.add_argument("--output", type=Path, help="完整报告 JSON 输出路径")
+    parser.add_argument("--per-word", type=Path, help="逐词条统计 CSV 输出路径")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="最难 / 最常学会词条的展示数量")
+    parser.add_argument("--min-users", type=int, default=DEFAULT_MIN_USERS, help="参与最难词条排名所需的最少用户数")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """主流程：建立词条索引 -> 流式读取备份 -> 向量化统计 -> 输出报告。"""
+    args = parse_args()
+
+    index = load_word_index(args.words)
+    print(f"[step] word index: {len(index.ids)} words", flush=True)
+
+    columns = load_record_columns(iter_backup_paths(args.inputs), index)
+    print(f"[step] loaded {len(columns.user_names)} backups, {columns.word.size} records", flush=True)
+
+    report, per_word = analyze(index, columns, top=args.top, min_users=args.min_users)
+    print_summary(report)
+
+    if args.output:
+        with args.output.open("w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+            file.write("\n")
+        print("[done] report written:", args.output, flush=True)
+
+    if args.per_word:
+        write_per_word_csv(args.per_word, index, per_word)
+        print("[done] per-word csv written:", args.per_word, flush=True)
+
+
+if __name__ == "__main__":
+    main()
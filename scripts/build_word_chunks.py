@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+把 parsed_words_11620.json 按难度拆分为内容哈希分片，供前端按需加载。
+
+输出（默认写入 public/data/）：
+- words-lv{难度}.{哈希}.json：该难度下的原始词条，附带原始下标 `index`
+- manifest.json：分片清单（难度、文件名、哈希、词条数）
+
+实现说明：
+1) 难度映射与前端 `mapWordLevelToDifficulty` 保持一致（level 0~10 -> Lv.1~Lv.10）
+2) 文件名中的哈希取自分片内容，内容不变则文件名不变，可长期缓存
+3) 词条 ID 由原始下标生成（word-{index}），拆分后学习记录仍可对应
+4) 旧的分片文件会被清理，避免 public/data 中残留过期数据
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+INPUT_PATH = Path("parsed_words_11620.json")
+OUTPUT_DIR = Path("public/data")
+MANIFEST_NAME = "manifest.json"
+CHUNK_PREFIX = "words-lv"
+
+DIFFICULTY_LEVELS = range(1, 11)
+DEFAULT_WORD_LEVEL = 10
+HASH_LENGTH = 12
+
+
+def map_word_level_to_difficulty(level: Any) -> int:
+    """根据词条 level（0~10）映射到游戏难度（1~10）。"""
+    if isinstance(level, bool) or not isinstance(level, (int, float)) or not math.isfinite(level):
+        level = DEFAULT_WORD_LEVEL
+
+    normalized = min(10, max(0, level))
+    if normalized >= 9:
+        return 10
+
+    return math.floor(normalized) + 1
+
+
+def serialize_chunk(entries: list[dict[str, Any]]) -> bytes:
+    """以紧凑格式序列化分片，保证相同内容得到相同字节。"""
+    text = json.dumps(entries, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def content_hash(payload: bytes) -> str:
+    """计算分片内容哈希。"""
+    return hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+
+
+def remove_stale_chunks(output_dir: Path, keep: set[str]) -> int:
+    """删除不在本次清单中的旧分片，返回删除数量。"""
+    removed = 0
+
+    for path in output_dir.glob(f"{CHUNK_PREFIX}*.json"):
+        if path.name in keep:
+            continue
+        path.unlink()
+        removed += 1
+
+    return removed
+
+
+def main() -> None:
+    """主流程：读取词库 -> 按难度分组 -> 写出哈希分片与清单。"""
+    if not INPUT_PATH.exists():
+        raise FileNotFoundError(f"输入文件不存在: {INPUT_PATH}")
+
+    with INPUT_PATH.open("r", encoding="utf-8") as file:
+        words: list[dict[str, Any]] = json.load(file)
+
+    groups: dict[int, list[dict[str, Any]]] = {difficulty: [] for difficulty in DIFFICULTY_LEVELS}
+
+    for index, word in enumerate(words):
+        difficulty = map_word_level_to_difficulty(word.get("level"))
+        groups[difficulty].append({"index": index, **word})
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    chunks: list[dict[str, Any]] = []
+    written = 0
+
+    for difficulty in DIFFICULTY_LEVELS:
+        payload = serialize_chunk(groups[difficulty])
+        digest = content_hash(payload)
+        file_name = f"{CHUNK_PREFIX}{difficulty}.{digest}.json"
+        target = OUTPUT_DIR / file_name
+
+        # 同名文件内容必然相同，跳过写入以保留文件时间戳。
+        if not target.exists():
+            target.write_bytes(payload)
+            written += 1
+
+        chunks.append(
+            {
+                "difficulty": difficulty,
+                "file": file_name,
+                "hash": digest,
+                "count": len(groups[difficulty]),
+            }
+        )
+
+    manifest = {
+        "version": content_hash("".join(chunk["hash"] for chunk in chunks).encode("utf-8")),
+        "total": len(words),
+        "chunks": chunks,
+    }
+
+    with (OUTPUT_DIR / MANIFEST_NAME).open("w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+    removed = remove_stale_chunks(OUTPUT_DIR, {chunk["file"] for chunk in chunks})
+
+    print(f"[summary] words: {len(words)}, chunks: {len(chunks)}", flush=True)
+    print(f"[summary] written: {written}, unchanged: {len(chunks) - written}, removed: {removed}", flush=True)
+    print("[done] manifest version:", manifest["version"], flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+分级解析 parsed_words_11620.json 的释义与例句（本地优先，远程兜底）。
+
+按顺序尝试以下后端，前一级命中的词条不会进入下一级：
+1) cache：本地解析缓存（word_meanings_cache.json）
+2) jmdict：本地 JMdict 英文义项 + Argos 翻译为日文、中文
+3) argos：本地 Argos 直接翻译词条（ja->en / ja->zh）
+4) remote：远程翻译接口，仅处理前三级都未命中的词条
+
+结束时输出每一级的尝试数与命中数；每一级的新解析结果立即写回缓存，
+下次运行时已解析的词条不会再访问词典或网络。后端只在仍有待解析词条时才加载。
+
+依赖说明：
+- jmdict / argos 级需要 jamdict、jamdict-data、argostranslate，只在启用时导入
+- 可用 `--tiers cache,jmdict` 之类的参数只启用部分后端（例如离线运行）
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from rewrite_all_ai_meanings_examples import (
+    build_examples,
+    dedupe,
+    normalize,
+    split_english_meanings,
+    split_zh_meanings,
+    translate_map,
+)
+
+INPUT_PATH = Path("parsed_words_11620.json")
+OUTPUT_PATH = Path("parsed_words_11620.json")
+CACHE_PATH = Path("word_meanings_cache.json")
+
+TIER_NAMES = ("cache", "jmdict", "argos", "remote")
+
+MAX_MEANINGS = 5
+UNKNOWN_JP = "辞書で語義を確認できませんでした"
+UNKNOWN_ZH = "未能在词典中检索到该词释义"
+ASCII_RE = re.compile(r"[A-Za-z]")
+CJK_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+
+# 词条唯一键：(汉字, 读音)。
+WordKey = tuple[str, str]
+
+
+@dataclass
+class Meanings:
+    """一个词条的解析结果。"""
+
+    jp_meanings: list[str]
+    zh_meanings: list[str]
+    source: str
+
+
+@dataclass
+class Tier:
+    """解析后端：输入待解析词条，返回命中的结果。"""
+
+    name: str
+    resolve: Callable[[list[WordKey]], dict[WordKey, Meanings]]
+
+
+@dataclass
+class TierStats:
+    """单个后端的命中统计。"""
+
+    attempted: int = 0
+    hits: int = 0
+
+
+def key_of(kanji: str, ruby: str) -> WordKey:
+    """规范化后的词条键。"""
+    return (normalize(kanji), normalize(ruby))
+
+
+def cache_key(key: WordKey) -> str:
+    """缓存文件中的字符串键。"""
+    return f"{key[0]}|{key[1]}"
+
+
+def strip_ascii_meanings(values: list[str]) -> list[str]:
+    """去掉仍残留英文的日语释义。"""
+    return [value for value in values if not ASCII_RE.search(value)]
+
+
+def keep_cjk_meanings(values: list[str]) -> list[str]:
+    """只保留包含汉字的中文释义，去掉翻译失败回退的英文原文。"""
+    return [value for value in values if CJK_RE.search(value)]
+
+
+class TierUnavailable(Exception):
+    """后端依赖（库或语言模型）缺失，无法构建。"""
+
+
+def require_argos_languages(*codes: str) -> Any:
+    """检查 Argos 语言模型是否已安装，缺失时抛出 TierUnavailable。"""
+    from argostranslate import translate
+
+    languages = {lang.code: lang for lang in translate.get_installed_languages()}
+    missing = [code for code in codes if code not in languages]
+    if missing:
+        raise TierUnavailable(f"argos language not installed: {', '.join(missing)}")
+
+    return languages
+
+
+def load_cache(path: Path) -> dict[str, dict[str, Any]]:
+    """读取解析缓存，文件不存在或损坏时返回空缓存。"""
+    if not path.exists():
+        return {}
+
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            payload = json.load(file)
+    except (OSError, json.JSONDecodeError):
+        print(f"[cache] unreadable, ignored: {path}", flush=True)
+        return {}
+
+    return payload if isinstance(payload, dict) else {}
+
+
+def save_cache(path: Path, cache: dict[str, dict[str, Any]]) -> None:
+    """写回解析缓存。"""
+    with path.open("w", encoding="utf-8") as file:
+        json.dump(cache, file, ensure_ascii=False, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def build_cache_tier(cache: dict[str, dict[str, Any]]) -> Tier:
+    """缓存级：直接读取历史解析结果。"""
+
+    def resolve(keys: list[WordKey]) -> dict[WordKey, Meanings]:
+        resolved: dict[WordKey, Meanings] = {}
+
+        for key in keys:
+            entry = cache.get(cache_key(key))
+            if not entry or not entry.get("jp_meanings") or not entry.get("zh_meanings"):
+                continue
+
+            resolved[key] = Meanings(
+                jp_meanings=list(entry["jp_meanings"]),
+                zh_meanings=list(entry["zh_meanings"]),
+                source="cache",
+            )
+
+        return resolved
+
+    return Tier(name="cache", resolve=resolve)
+
+
+def build_jmdict_tier() -> Tier:
+    """JMdict 级：本地词典取英文义项，再用 Argos 翻译为日中释义。"""
+    import jamdict_data
+    from jamdict import Jamdict
+
+    from enrich_word_meanings import build_translation_map, choose_best_jam_bundle
+
+    # build_translation_map 需要 en / ja / zh 模型，缺失时会在解析中途失败，这里提前检查。
+    require_argos_languages("en", "ja", "zh")
+
+    jam = Jamdict(db_file=jamdict_data.JAMDICT_DB_PATH, auto_expand=False)
+    lookup_cache: dict[str, list[Any]] = {}
+
+    def jam_entries(query: str) -> list[Any]:
+        if query not in lookup_cache:
+            lookup_cache[query] = jam.lookup(query).entries
+        return lookup_cache[query]
+
+    def resolve(keys: list[WordKey]) -> dict[WordKey, Meanings]:
+        bundles: dict[WordKey, list[str]] = {}
+
+        for idx, key in enumerate(keys, start=1):
+            kanji, ruby = key
+            bundle = choose_best_jam_bundle(jam_entries(kanji), kanji, ruby)
+            if not bundle.found and ruby:
+                bundle = choose_best_jam_bundle(jam_entries(ruby), kanji, ruby)
+
+            if bundle.found:
+                bundles[key] = bundle.en_meanings
+
+            if idx % 1000 == 0 or idx == len(keys):
+                print(f"[jmdict] {idx}/{len(keys)}", flush=True)
+
+        unique_en = dedupe([text for meanings in bundles.values() for text in meanings])
+        ja_map, zh_map = build_translation_map(unique_en) if unique_en else ({}, {})
+
+        resolved: dict[WordKey, Meanings] = {}
+        for key, en_meanings in bundles.items():
+            # 翻译失败时会回退为英文原文，去掉后未命中的词条交给下一级。
+            jp_meanings = strip_ascii_meanings(dedupe([ja_map.get(text, text) for text in en_meanings]))[:MAX_MEANINGS]
+            zh_meanings = keep_cjk_meanings(dedupe([zh_map.get(text, "") for text in en_meanings]))[:MAX_MEANINGS]
+
+            if jp_meanings and zh_meanings:
+                resolved[key] = Meanings(jp_meanings=jp_meanings, zh_meanings=zh_meanings, source="jmdict")
+
+        return resolved
+
+    return Tier(name="jmdict", resolve=resolve)
+
+
+def build_argos_tier() -> Tier:
+    """Argos 级：本地模型直接翻译词条，再把英文义项翻译回日文。"""
+    languages = require_argos_languages("ja", "en")
+
+    def translator(source: str, target: str) -> Any:
+        if source not in languages or target not in languages:
+            return None
+        return languages[source].get_translation(languages[target])
+
+    ja_to_en = translator("ja", "en")
+    ja_to_zh = translator("ja", "zh")
+    en_to_ja = translator("en", "ja")
+    en_to_zh = translator("en", "zh")
+
+    if ja_to_en is None:
+        raise TierUnavailable("argos ja->en model not installed")
+
+    def run(model: Any, text: str) -> str:
+        if model is None or not text:
+            return ""
+        try:
+            return normalize(model.translate(text))
+        except Exception:
+            return ""
+
+    def resolve(keys: list[WordKey]) -> dict[WordKey, Meanings]:
+        resolved: dict[WordKey, Meanings] = {}
+
+        for idx, key in enumerate(keys, start=1):
+            kanji = key[0]
+            en_text = run(ja_to_en, kanji)
+
+            # 模型无法翻译时通常原样返回输入，视为未命中。
+            if en_text and en_text != kanji and ASCII_RE.search(en_text):
+                en_parts = split_english_meanings(en_text)
+                jp_meanings = strip_ascii_meanings(dedupe([run(en_to_ja, part) for part in en_parts]))
+                zh_meanings = dedupe(
+                    split_zh_meanings(run(ja_to_zh, kanji)) + [run(en_to_zh, part) for part in en_parts]
+                )[:3]
+
+                if jp_meanings and zh_meanings:
+                    resolved[key] = Meanings(
+                        jp_meanings=jp_meanings[:3],
+                        zh_meanings=zh_meanings,
+                        source="argos",
+                    )
+
+            if idx % 500 == 0 or idx == len(keys):
+                print(f"[argos] {idx}/{len(keys)}", flush=True)
+
+        return resolved
+
+    return Tier(name="argos", resolve=resolve)
+
+
+def build_remote_tier() -> Tier:
+    """远程级：与 rewrite_all_ai_meanings_examples.py 相同的翻译流程，但只处理剩余词条。"""
+
+    def resolve(keys: list[WordKey]) -> dict[WordKey, Meanings]:
+        unique_kanji = dedupe([kanji for kanji, _ in keys])
+
+        kanji_to_en = translate_map(unique_kanji, source="ja", target="en", label="ja->en")
+        kanji_to_zh = translate_map(unique_kanji, source="ja", target="zh-CN", label="ja->zh")
+
+        unique_en_parts = dedupe(
+            [part for kanji in unique_kanji for part in split_english_meanings(kanji_to_en.get(kanji, ""))]
+        )
+        en_to_ja = translate_map(unique_en_parts, source="en", target="ja", label="en->ja")
+        en_to_zh = translate_map(unique_en_parts, source="en", target="zh-CN", label="en->zh")
+
+        resolved: dict[WordKey, Meanings] = {}
+        for key in keys:
+            kanji = key[0]
+            en_parts = split_english_meanings(kanji_to_en.get(kanji, ""))
+
+            jp_meanings = strip_ascii_meanings(dedupe([en_to_ja.get(part, "") for part in en_parts]))[:3]
+            zh_meanings = dedupe(
+                split_zh_meanings(kanji_to_zh.get(kanji, "")) + [en_to_zh.get(part, "") for part in en_parts]
+            )[:3]
+
+            if jp_meanings and zh_meanings:
+                resolved[key] = Meanings(
+                    jp_meanings=jp_meanings,
+                    zh_meanings=zh_meanings,
+                    source="remote",
+                )
+
+        return resolved
+
+    return Tier(name="remote", resolve=resolve)
+
+
+def run_cascade(
+    keys: list[WordKey],
+    builders: list[tuple[str, Callable[[], Tier]]],
+    on_resolved: Callable[[str, dict[WordKey, Meanings]], None],
+) -> tuple[dict[WordKey, Meanings], dict[str, TierStats]]:
+    """按顺序执行各级后端，只把未命中的词条交给下一级。
+
+    后端在确实有待解析词条时才构建，缓存全部命中时不会加载词典或模型；
+    依赖缺失的后端记录为 0 尝试并跳过，全部待解析词条交给下一级；
+    每一级有命中后立即回调 `on_resolved`，便于及时落盘。
+    """
+    results: dict[WordKey, Meanings] = {}
+    stats: dict[str, TierStats] = {name: TierStats() for name, _ in builders}
+    pending = list(keys)
+
+    for name, build in builders:
+        if not pending:
+            break
+
+        try:
+            tier = build()
+        except (ImportError, TierUnavailable) as error:
+            print(f"[{name}] unavailable, skipped: {error}", flush=True)
+            continue
+
+        print(f"[step] tier {name}: {len(pending)} pending", flush=True)
+        resolved = tier.resolve(pending)
+
+        stats[name].attempted = len(pending)
+        stats[name].hits = len(resolved)
+
+        results.update(resolved)
+        pending = [key for key in pending if key not in resolved]
+
+        if resolved:
+            on_resolved(name, resolved)
+
+    return results, stats
+
+
+def tier_builders(names: list[str], cache: dict[str, dict[str, Any]]) -> list[tuple[str, Callable[[], Tier]]]:
+    """按固定顺序列出启用后端的构建函数，依赖在构建时才导入。"""
+    builders: dict[str, Callable[[], Tier]] = {
+        "cache": lambda: build_cache_tier(cache),
+        "jmdict": build_jmdict_tier,
+        "argos": build_argos_tier,
+        "remote": build_remote_tier,
+    }
+
+    return [(name, builders[name]) for name in TIER_NAMES if name in names]
+
+
+def print_stats(stats: dict[str, TierStats], total: int, unresolved: int) -> None:
+    """输出每一级的命中统计。"""
+    print("[summary] tier       attempted     hits   hit-rate", flush=True)
+    for name, item in stats.items():
+        rate = item.hits / item.attempted if item.attempted else 0.0
+        print(f"[summary] {name:<8} {item.attempted:>11} {item.hits:>8} {rate:>9.1%}", flush=True)
+
+    print(f"[summary] resolved {total - unresolved}/{total}, unresolved {unresolved}", flush=True)
+
+
+def parse_args() -> argparse.Namespace:
+    """解析命令行参数。"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--tiers",
+        default=",".join(TIER_NAMES),
+        help=f"启用的后端，逗号分隔，执行顺序固定为 {','.join(TIER_NAMES)}",
+    )
+    parser.add_argument("--cache", type=Path, default=CACHE_PATH, help="解析缓存文件路径")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.tiers.split(",") if name.strip()]
+    unknown = [name for name in names if name not in TIER_NAMES]
+    if unknown:
+        parser.error(f"未知后端: {', '.join(unknown)}")
+
+    args.tiers = names
+    return args
+
+
+def main() -> None:
+    """主流程：分级解析 -> 更新缓存 -> 组装字段 -> 回写 JSON。"""
+    args = parse_args()
+
+    if not INPUT_PATH.exists():
+        raise FileNotFoundError(f"文件不存在: {INPUT_PATH}")
+
+    with INPUT_PATH.open("r", encoding="utf-8") as file:
+        words: list[dict[str, Any]] = json.load(file)
+
+    keys = list(dict.fromkeys(key_of(str(item.get("kanji", "")), str(item.get("ruby", ""))) for item in words))
+    print(f"[step] total words: {len(words)}, unique entries: {len(keys)}", flush=True)
+
+    cache = load_cache(args.cache)
+
+    def store_resolved(tier_name: str, resolved: dict[WordKey, Meanings]) -> None:
+        # 每一级结束后立即写回缓存，后续级别中断时已解析的结果不会丢失。
+        if "cache" not in args.tiers or tier_name == "cache":
+            return
+
+        for key, meanings in resolved.items():
+            cache[cache_key(key)] = {
+                "jp_meanings": meanings.jp_meanings,
+                "zh_meanings": meanings.zh_meanings,
+                "source": meanings.source,
+            }
+        save_cache(args.cache, cache)
+        print(f"[cache] stored {len(resolved)} new entries from {tier_name}: {args.cache}", flush=True)
+
+    results, stats = run_cascade(keys, tier_builders(args.tiers, cache), store_resolved)
+
+    print("[step] composing fields", flush=True)
+    for item in words:
+        kanji, ruby = key_of(str(item.get("kanji", "")), str(item.get("ruby", "")))
+        meanings = results.get((kanji, ruby))
+
+        if meanings is None:
+            # 已有释义的词条保持不变（例如只启用了部分后端）。
+            if item.get("jp_meanings") and item.get("zh_meanings"):
+                continue
+
+            # 写入占位值，便于 fill_missing_with_ai.py 之后单独处理。
+            item["jp_meanings"] = [UNKNOWN_JP]
+            item["zh_meanings"] = [UNKNOWN_ZH]
+            item["example_sentence"] = f"「{kanji}（{ruby}）」という語は古語または稀な表現として扱われることがあります。"
+            item["example_translation"] = f"“{kanji}（{ruby}）”可能是古语或较少见的表达。"
+            continue
+
+        item["jp_meanings"] = meanings.jp_meanings
+        item["zh_meanings"] = meanings.zh_meanings
+        item["example_sentence"], item["example_translation"] = build_examples(
+            kanji=kanji,
+            ruby=ruby,
+            jp_meaning=meanings.jp_meanings[0],
+            zh_meaning=meanings.zh_meanings[0],
+        )
+
+    with OUTPUT_PATH.open("w", encoding="utf-8") as file:
+        json.dump(words, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+    print_stats(stats, total=len(keys), unresolved=len(keys) - len(results))
+    print("[done] file updated:", OUTPUT_PATH, flush=True)
+
+
+if __name__ == "__main__":
+    main()